@@ -0,0 +1,125 @@
+"""
+Online anomaly detection for follower changes.
+Keeps an EWMA mean/variance of per-day deltas per account and flags outliers.
+"""
+import datetime
+import json
+import math
+import os
+
+
+class AnomalyDetector:
+    """
+    Streaming detector over per-account follower deltas.
+
+    State is O(1) per account (count, mean, variance), so each update costs
+    the same regardless of how much history has been tracked.
+    """
+
+    def __init__(self, state_path='anomaly_state.json', alpha=0.1, threshold=3.0,
+                 warmup=5, min_std=1.0):
+        """
+        Initialize anomaly detector.
+
+        Args:
+            state_path (str): Path to JSON file holding per-account state
+            alpha (float): EWMA smoothing factor (0 < alpha <= 1)
+            threshold (float): Absolute z-score above which a delta is flagged
+            warmup (int): Observations required before flagging anything
+            min_std (float): Lower bound on standard deviation (followers are integers)
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+
+        self.state_path = state_path
+        self.alpha = alpha
+        self.threshold = threshold
+        self.warmup = warmup
+        self.min_std = min_std
+        self.accounts = {}
+        self.load()
+
+    def load(self):
+        """Load persisted state, starting fresh if none exists."""
+        try:
+            with open(self.state_path, 'r') as f:
+                self.accounts = json.load(f).get('accounts', {})
+        except FileNotFoundError:
+            self.accounts = {}
+
+    def save(self):
+        """Persist state atomically."""
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': 1, 'accounts': self.accounts}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def update(self, account, delta, date):
+        """
+        Score a new delta against the account's history, then fold it in.
+
+        Deltas dated on or before the account's last observation are ignored,
+        so re-running on the same day does not count the day twice. A delta
+        spanning several days (e.g. after a skipped scheduled run) is scored
+        as the per-day average over the days elapsed.
+
+        Args:
+            account (str): Account identifier
+            delta (int): Change from previous count
+            date (str): Record date (YYYY-MM-DD)
+
+        Returns:
+            dict: anomaly (bool), zscore (float or None), mean and std before
+                update, days covered by the delta, or None if the date was
+                already observed
+        """
+        state = self.accounts.setdefault(account, {'n': 0, 'mean': 0.0, 'var': 0.0, 'last_date': None})
+        last_date = state.get('last_date')
+        if last_date and date <= last_date:
+            return None
+
+        days = 1
+        if last_date:
+            elapsed = datetime.date.fromisoformat(date[:10]) - datetime.date.fromisoformat(last_date[:10])
+            days = max(elapsed.days, 1)
+        delta = delta / days
+        state['last_date'] = date
+
+        mean = state['mean']
+        std = max(math.sqrt(state['var']), self.min_std)
+
+        zscore = None
+        anomaly = False
+        if state['n'] >= self.warmup:
+            zscore = (delta - mean) / std
+            anomaly = abs(zscore) > self.threshold
+
+        if state['n'] == 0:
+            state['mean'] = float(delta)
+        else:
+            # Winsorize outliers so a single spike does not inflate the baseline
+            value = delta
+            if anomaly:
+                bound = self.threshold * std
+                value = min(max(delta, mean - bound), mean + bound)
+            diff = value - mean
+            increment = self.alpha * diff
+            state['mean'] = mean + increment
+            state['var'] = (1 - self.alpha) * (state['var'] + diff * increment)
+        state['n'] += 1
+
+        return {'anomaly': anomaly, 'zscore': zscore, 'mean': mean, 'std': std, 'days': days}
+
+
+def get_anomaly_detector():
+    """
+    Factory function to get an anomaly detector configured from environment.
+
+    Returns:
+        AnomalyDetector: Configured detector instance
+    """
+    return AnomalyDetector(
+        state_path=os.getenv('ANOMALY_STATE_FILE', 'anomaly_state.json'),
+        alpha=float(os.getenv('ANOMALY_ALPHA', '0.1')),
+        threshold=float(os.getenv('ANOMALY_THRESHOLD', '3.0')),
+    )
@@ -0,0 +1,166 @@
+"""
+Export followers history to columnar formats.
+Streams records from any storage backend into Parquet or Arrow IPC files.
+"""
+import argparse
+import datetime
+import os
+
+DEFAULT_BATCH_SIZE = 10000
+FORMATS = ('parquet', 'arrow')
+
+# File extensions used to infer the output format
+FORMAT_EXTENSIONS = {
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow',
+}
+
+
+def _import_pyarrow():
+    """Import pyarrow lazily so the tracker itself does not depend on it."""
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ImportError(
+            "Parquet/Arrow export requires: pip install pyarrow"
+        )
+
+
+def get_schema(pa):
+    """
+    Build the typed Arrow schema for exported records.
+
+    Args:
+        pa (module): Imported pyarrow module
+
+    Returns:
+        pyarrow.Schema: Export schema
+    """
+    return pa.schema([
+        ('date', pa.date32()),
+        ('account', pa.string()),
+        ('followers_count', pa.int64()),
+        ('delta', pa.int64()),
+        ('rate', pa.float64()),
+    ])
+
+
+def iter_batches(records, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Group a record stream into lists of at most batch_size records.
+
+    Args:
+        records (iterable): Records as yielded by StorageBackend.iter_records
+        batch_size (int): Maximum records per batch
+
+    Yields:
+        list: Batch of records
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _to_record_batch(pa, schema, batch, default_account=None):
+    """Convert a list of records into an Arrow RecordBatch."""
+    return pa.RecordBatch.from_arrays([
+        pa.array([datetime.date.fromisoformat(r['date'][:10]) for r in batch], type=pa.date32()),
+        pa.array([r.get('account') or default_account for r in batch], type=pa.string()),
+        pa.array([r['followers_count'] for r in batch], type=pa.int64()),
+        pa.array([r.get('delta') for r in batch], type=pa.int64()),
+        pa.array([r.get('rate') for r in batch], type=pa.float64()),
+    ], schema=schema)
+
+
+def infer_format(output_path):
+    """
+    Infer export format from the output file extension.
+
+    Returns:
+        str: 'parquet' or 'arrow' (defaults to 'parquet')
+    """
+    extension = os.path.splitext(output_path)[1].lower()
+    return FORMAT_EXTENSIONS.get(extension, 'parquet')
+
+
+def export_records(records, output_path, fmt='parquet', batch_size=DEFAULT_BATCH_SIZE,
+                   default_account=None):
+    """
+    Stream records into a Parquet or Arrow IPC file.
+
+    Only one batch is held in memory at a time; each batch becomes a
+    Parquet row group or an Arrow record batch.
+
+    Args:
+        records (iterable): Records as yielded by StorageBackend.iter_records
+        output_path (str): Destination file
+        fmt (str): 'parquet' or 'arrow'
+        batch_size (int): Records per row group / record batch
+        default_account (str): Account for single-account rows (as in
+            report.rebuild_summary), or None to leave them null
+
+    Returns:
+        int: Number of records written
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt} (expected one of {', '.join(FORMATS)})")
+
+    pa = _import_pyarrow()
+    schema = get_schema(pa)
+
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(output_path, schema)
+        write = lambda rb: writer.write_table(pa.Table.from_batches([rb]))
+    else:
+        import pyarrow.ipc
+        writer = pyarrow.ipc.new_file(output_path, schema)
+        write = writer.write_batch
+
+    total = 0
+    try:
+        for batch in iter_batches(records, batch_size):
+            write(_to_record_batch(pa, schema, batch, default_account))
+            total += len(batch)
+    finally:
+        writer.close()
+
+    return total
+
+
+def main(argv=None):
+    """
+    Command-line entry point: export the configured backend's history.
+    """
+    parser = argparse.ArgumentParser(description="Export followers history to Parquet or Arrow IPC")
+    parser.add_argument('output', help="Output file path (e.g. history.parquet)")
+    parser.add_argument('--format', choices=FORMATS, help="Output format (default: inferred from extension)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Records per row group (default: {DEFAULT_BATCH_SIZE})")
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+    from storage import get_storage_backend
+
+    load_dotenv()
+
+    fmt = args.format or infer_format(args.output)
+    storage = get_storage_backend()
+    total = export_records(storage.iter_records(), args.output, fmt, args.batch_size,
+                           default_account=os.getenv('X_USERNAME', 'default'))
+    print(f"✓ Exported {total} records to {args.output} ({fmt})")
+
+
+if __name__ == "__main__":
+    main()
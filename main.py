@@ -1,31 +1,138 @@
 """
 X.com Followers Tracker
 Automatically tracks follower count daily and calculates growth metrics.
+
+Heavy imports (requests, python-dotenv, optional modules) are deferred until
+needed, so short runs such as a CSV run with a cached count start quickly.
 """
-import requests
 import os
 import time
-from dotenv import load_dotenv
+import datetime
+import json
 from storage import get_storage_backend
 
+
+def _load_env():
+    """
+    Load environment variables from .env.
+
+    python-dotenv is only imported when a .env file exists, searching from
+    this script's directory upwards like load_dotenv() itself does.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        if os.path.isfile(os.path.join(directory, '.env')):
+            from dotenv import load_dotenv
+            load_dotenv(os.path.join(directory, '.env'))
+            return
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return
+        directory = parent
+
+
 # Load environment variables
-load_dotenv()
+_load_env()
 
 BEARER_TOKEN = os.getenv('X_BEARER_TOKEN')
 USERNAME = os.getenv('X_USERNAME')
 
 
-def get_followers_count():
+class FollowersCache:
+    """
+    Followers counts cached for FOLLOWERS_CACHE_TTL seconds.
+
+    The cache file is read once on first use and written once by save(),
+    so a run over many accounts costs a single load and a single write.
+    """
+
+    def __init__(self, cache_path=None, ttl=None):
+        """
+        Initialize followers cache.
+
+        Args:
+            cache_path (str): Cache file (defaults to FOLLOWERS_CACHE_FILE)
+            ttl (float): Entry lifetime in seconds, 0 disables caching
+                (defaults to FOLLOWERS_CACHE_TTL)
+        """
+        self.cache_path = cache_path or os.getenv('FOLLOWERS_CACHE_FILE', '.followers_cache.json')
+        self.ttl = float(os.getenv('FOLLOWERS_CACHE_TTL', '0')) if ttl is None else ttl
+        self.entries = None
+        self.dirty = False
+
+    def _load(self):
+        """Read the cache file on first use."""
+        if self.entries is None:
+            try:
+                with open(self.cache_path, 'r') as f:
+                    self.entries = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self.entries = {}
+
+    def get(self, username):
+        """
+        Get a cached followers count younger than the TTL.
+
+        Returns:
+            int: Cached followers count, or None if disabled, missing or stale
+        """
+        if self.ttl <= 0:
+            return None
+        self._load()
+        entry = self.entries.get(username.lower())
+        if entry and time.time() - entry['fetched_at'] < self.ttl:
+            return entry['count']
+        return None
+
+    def set(self, username, count):
+        """Remember a freshly fetched followers count."""
+        if self.ttl <= 0:
+            return
+        self._load()
+        self.entries[username.lower()] = {'count': count, 'fetched_at': time.time()}
+        self.dirty = True
+
+    def save(self):
+        """Write the cache file atomically if anything changed."""
+        if not self.dirty:
+            return
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+
+def get_followers_count(username=None, cache=None):
     """
     Fetch current followers count from X API.
 
+    A fresh cached count is returned without importing the HTTP stack.
+
+    Args:
+        username (str): Account to look up, defaults to X_USERNAME
+        cache (FollowersCache): Shared cache, saved by the caller; when
+            omitted a cache is opened and saved for this lookup alone
+
     Returns:
         int: Current followers count
 
     Raises:
         Exception: If API call fails after retry
     """
-    url = f"https://api.twitter.com/2/users/by/username/{USERNAME}?user.fields=public_metrics"
+    username = username or USERNAME
+    owns_cache = cache is None
+    if owns_cache:
+        cache = FollowersCache()
+
+    cached_count = cache.get(username)
+    if cached_count is not None:
+        print(f"✓ Using cached followers count: {cached_count}")
+        return cached_count
+
+    import requests
+
+    url = f"https://api.twitter.com/2/users/by/username/{username}?user.fields=public_metrics"
     headers = {"Authorization": f"Bearer {BEARER_TOKEN}"}
 
     # Retry logic: try up to 2 times
@@ -36,6 +143,9 @@ def get_followers_count():
                 data = response.json()
                 followers_count = data['data']['public_metrics']['followers_count']
                 print(f"✓ Successfully fetched followers count: {followers_count}")
+                cache.set(username, followers_count)
+                if owns_cache:
+                    cache.save()
                 return followers_count
             else:
                 print(f"✗ API error (attempt {attempt + 1}/2): {response.status_code} - {response.text}")
@@ -49,6 +159,54 @@ def get_followers_count():
     raise Exception("Failed to fetch followers count after 2 attempts")
 
 
+def check_anomaly(account, delta, date):
+    """
+    Update the streaming anomaly detector and report unusual changes.
+
+    Args:
+        account (str): Account identifier
+        delta (int): Change from previous count
+        date (str): Record date (YYYY-MM-DD)
+
+    Returns:
+        bool: True if the change was flagged as anomalous
+    """
+    try:
+        from anomaly import get_anomaly_detector
+        detector = get_anomaly_detector()
+        result = detector.update(account, delta, date)
+        if result is None:
+            return False  # Already observed today
+        detector.save()
+    except Exception as e:
+        print(f"⚠ Anomaly detection skipped: {e}")
+        return False
+
+    if result['anomaly']:
+        span = f" over {result['days']} days" if result['days'] > 1 else ""
+        print(f"⚠ Anomaly detected for @{account}: Δ{delta:+d}{span} "
+              f"(z={result['zscore']:+.1f}, expected {result['mean']:+.1f} ± {result['std']:.1f}/day)")
+    return result['anomaly']
+
+
+def update_report_summary(account, current_count, delta):
+    """
+    Fold today's record into the materialized report summary.
+
+    Args:
+        account (str): Account identifier
+        current_count (int): Current followers count
+        delta (int): Change from previous count
+    """
+    try:
+        from report import get_summary_store
+        store = get_summary_store()
+        if store.update(account, datetime.date.today().isoformat(), current_count, delta):
+            store.save()
+    except Exception as e:
+        print(f"⚠ Report summary update skipped: {e}")
+
+
 def main():
     """
     Main execution logic.
@@ -85,13 +243,44 @@ def main():
     delta = current_count - last_count
     growth_rate = (delta / last_count * 100) if last_count > 0 else 0.0
 
-    # Save record
+    # Save record and fold it into the report summary
     storage.save_record(current_count, delta, growth_rate)
+    update_report_summary(USERNAME, current_count, delta)
+
+    # Flag sudden gains or losses (first run has no meaningful delta)
+    if last_count > 0:
+        check_anomaly(USERNAME, delta, datetime.date.today().isoformat())
 
     print("=" * 60)
     print("✓ Tracking completed successfully")
     print("=" * 60)
 
 
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+
+    Args:
+        argv (list): Arguments (defaults to sys.argv)
+
+    Returns:
+        argparse.Namespace: Parsed options
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="X Followers Tracker")
+    parser.add_argument('--profile', nargs='?', const='profile_report.txt', metavar='REPORT',
+                        help="Profile the run with cProfile and tracemalloc "
+                             "(report default: profile_report.txt)")
+    parser.add_argument('--profile-collapsed', metavar='PATH',
+                        help="Also write flamegraph-compatible collapsed stacks (implies --profile)")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.profile or args.profile_collapsed:
+        from profiling import run_profiled
+        run_profiled(main, args.profile or 'profile_report.txt', args.profile_collapsed)
+    else:
+        main()
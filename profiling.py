@@ -0,0 +1,186 @@
+"""
+Built-in profiling for tracker runs.
+Wraps a run in cProfile and tracemalloc and writes a hot-function report,
+peak allocation sites and optionally flamegraph-compatible collapsed stacks.
+"""
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+
+class _PeakSampler(threading.Thread):
+    """
+    Background thread that snapshots tracemalloc whenever traced memory
+    reaches a new high, so allocation sites can be reported at the peak
+    rather than at the end of the run.
+    """
+
+    def __init__(self, interval=0.01, growth=1.05):
+        """
+        Args:
+            interval (float): Polling interval in seconds
+            growth (float): Minimum growth over the last snapshot to re-snapshot
+        """
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.snapshot = None
+        self.snapshot_size = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Take a snapshot if traced memory grew past the last one."""
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.sample()
+
+
+def _label(func):
+    """Format a pstats function key as a collapsed-stack frame."""
+    filename, lineno, name = func
+    if filename == '~':
+        return name.replace(';', ':')
+    return f"{name} ({os.path.basename(filename)}:{lineno})".replace(';', ':')
+
+
+def collapsed_stacks(stats, min_time=1e-6):
+    """
+    Reconstruct approximate collapsed stacks from a cProfile call graph.
+
+    cProfile only records caller/callee edges, so each function's time is
+    split across its callers in proportion to the cumulative time of each
+    edge. Branches contributing less than min_time are pruned.
+
+    Args:
+        stats (dict): pstats.Stats(...).stats
+        min_time (float): Smallest time in seconds to keep a branch
+
+    Returns:
+        dict: Tuple of frame labels -> self time in seconds
+    """
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+
+    stacks = {}
+    pending = [(func, (), frozenset(), 1.0) for func, value in stats.items() if not value[4]]
+    while pending:
+        func, path, seen, fraction = pending.pop()
+        tt, ct = stats[func][2], stats[func][3]
+        path = path + (_label(func),)
+        seen = seen | {func}
+
+        self_time = tt * fraction
+        if self_time > 0:
+            stacks[path] = stacks.get(path, 0.0) + self_time
+
+        for callee, edge_ct in callees.get(func, []):
+            callee_ct = stats[callee][3]
+            if callee in seen or callee_ct <= 0 or edge_ct * fraction < min_time:
+                continue
+            pending.append((callee, path, seen, edge_ct * fraction / callee_ct))
+    return stacks
+
+
+def write_collapsed(stats, path):
+    """
+    Write collapsed stacks ("frame;frame;frame microseconds" per line),
+    as consumed by flamegraph.pl, speedscope and similar tools.
+    """
+    with open(path, 'w') as f:
+        for stack, seconds in sorted(collapsed_stacks(stats).items()):
+            micros = int(seconds * 1e6)
+            if micros > 0:
+                f.write(f"{';'.join(stack)} {micros}\n")
+
+
+def format_report(profiler, snapshot, peak, elapsed, top_n=30):
+    """
+    Format the text profiling report.
+
+    Args:
+        profiler (cProfile.Profile): Finished profiler
+        snapshot (tracemalloc.Snapshot): Snapshot taken near peak memory
+        peak (int): Peak traced memory in bytes
+        elapsed (float): Wall-clock run time in seconds
+        top_n (int): Rows per section
+
+    Returns:
+        str: Report text
+    """
+    out = io.StringIO()
+    out.write("=" * 60 + "\n")
+    out.write("X Followers Tracker - Profile Report\n")
+    out.write("=" * 60 + "\n")
+    out.write(f"Wall time:   {elapsed:.3f}s\n")
+    out.write(f"Peak memory: {peak / 1024:.1f} KiB (traced Python allocations)\n")
+
+    for sort_key, title in (('cumulative', 'cumulative time'), ('tottime', 'own time')):
+        out.write(f"\n--- Top {top_n} functions by {title} ---\n")
+        pstats.Stats(profiler, stream=out).strip_dirs().sort_stats(sort_key).print_stats(top_n)
+
+    out.write(f"\n--- Top {top_n} allocation sites at peak ---\n")
+    if snapshot is not None:
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, threading.__file__),
+        ])
+        for stat in snapshot.statistics('lineno')[:top_n]:
+            out.write(f"{stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  {stat.traceback}\n")
+    return out.getvalue()
+
+
+def run_profiled(func, report_path='profile_report.txt', collapsed_path=None, top_n=30):
+    """
+    Run func under cProfile and tracemalloc and write the reports.
+
+    Timings include tracemalloc overhead; compare profiled runs with each
+    other rather than with unprofiled ones.
+
+    Args:
+        func (callable): Function to run
+        report_path (str): Path of the text report
+        collapsed_path (str): Path of collapsed-stack output (optional)
+        top_n (int): Rows per report section
+
+    Returns:
+        Return value of func
+    """
+    tracemalloc.start()
+    sampler = _PeakSampler()
+    sampler.start()
+    profiler = cProfile.Profile()
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        return func()
+    finally:
+        profiler.disable()
+        elapsed = time.perf_counter() - started
+        sampler.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        with open(report_path, 'w') as f:
+            f.write(format_report(profiler, sampler.snapshot, peak, elapsed, top_n))
+        print(f"✓ Profile report written to {report_path}")
+
+        if collapsed_path:
+            write_collapsed(pstats.Stats(profiler).stats, collapsed_path)
+            print(f"✓ Collapsed stacks written to {collapsed_path}")
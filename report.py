@@ -0,0 +1,273 @@
+"""
+Growth report generation from an incrementally maintained summary.
+Each saved record updates per-account monthly aggregates and running totals;
+the HTML/SVG report is rendered from that summary alone.
+"""
+import argparse
+import datetime
+import html
+import json
+import os
+
+
+class SummaryStore:
+    """
+    Materialized per-account summary of followers history.
+
+    Updating costs O(1) per new record and rendering only reads the
+    summary, so report generation never rescans raw rows.
+    """
+
+    def __init__(self, summary_path='report_summary.json'):
+        """
+        Initialize summary store.
+
+        Args:
+            summary_path (str): Path to JSON summary file
+        """
+        self.summary_path = summary_path
+        self.accounts = {}
+        self.load()
+
+    def load(self):
+        """Load persisted summary, starting empty if none exists."""
+        try:
+            with open(self.summary_path, 'r') as f:
+                self.accounts = json.load(f).get('accounts', {})
+        except FileNotFoundError:
+            self.accounts = {}
+
+    def save(self):
+        """Persist summary atomically."""
+        tmp_path = f"{self.summary_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': 1, 'accounts': self.accounts}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.summary_path)
+
+    def update(self, account, date, followers_count, delta):
+        """
+        Fold a newly saved record into the summary.
+
+        The first record of an account only sets its baseline. Records dated
+        on or before the account's last summarized date are ignored, so
+        re-running on the same day does not double count.
+
+        Args:
+            account (str): Account identifier
+            date (str): Record date (YYYY-MM-DD)
+            followers_count (int): Followers count on that date
+            delta (int): Change from previous count
+
+        Returns:
+            bool: True if the summary changed
+        """
+        summary = self.accounts.get(account)
+        if summary is None:
+            summary = self.accounts[account] = {
+                'first_date': date,
+                'first_count': followers_count,
+                'last_date': None,
+                'last_count': followers_count,
+                'records': 0,
+                'total_delta': 0,
+                'total_gain': 0,
+                'total_loss': 0,
+                'months': {},
+            }
+            delta = 0  # Baseline, not growth
+        elif date <= summary['last_date']:
+            return False
+
+        month_key = date[:7]
+        month = summary['months'].get(month_key)
+        if month is None:
+            month = summary['months'][month_key] = {
+                'start_count': followers_count - delta,
+                'end_count': followers_count,
+                'delta': 0,
+                'gain': 0,
+                'loss': 0,
+                'days': 0,
+            }
+
+        month['end_count'] = followers_count
+        month['delta'] += delta
+        month['days'] += 1
+        summary['total_delta'] += delta
+        if delta > 0:
+            month['gain'] += delta
+            summary['total_gain'] += delta
+        else:
+            month['loss'] -= delta
+            summary['total_loss'] -= delta
+
+        summary['last_date'] = date
+        summary['last_count'] = followers_count
+        summary['records'] += 1
+        return True
+
+    def monthly_totals(self):
+        """
+        Aggregate monthly deltas across all accounts.
+
+        Returns:
+            list: (month, delta, gain, loss) tuples sorted by month
+        """
+        totals = {}
+        for summary in self.accounts.values():
+            for key, month in summary['months'].items():
+                total = totals.setdefault(key, [0, 0, 0])
+                total[0] += month['delta']
+                total[1] += month['gain']
+                total[2] += month['loss']
+        return [(key, *totals[key]) for key in sorted(totals)]
+
+    def top_movers(self, top_n=10):
+        """
+        Rank accounts by change in their most recent month.
+
+        Returns:
+            list: (account, month, delta) tuples, largest absolute change first
+        """
+        movers = []
+        for account, summary in self.accounts.items():
+            if summary['months']:
+                key = max(summary['months'])
+                movers.append((account, key, summary['months'][key]['delta']))
+        movers.sort(key=lambda m: abs(m[2]), reverse=True)
+        return movers[:top_n]
+
+
+def _svg_line_chart(values, width=480, height=120, padding=8):
+    """Render a list of numbers as an inline SVG polyline."""
+    if not values:
+        return ''
+    low, high = min(values), max(values)
+    span = (high - low) or 1
+    step = (width - 2 * padding) / max(len(values) - 1, 1)
+    points = ' '.join(
+        f"{padding + i * step:.1f},{height - padding - (v - low) / span * (height - 2 * padding):.1f}"
+        for i, v in enumerate(values)
+    )
+    return (
+        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" '
+        f'xmlns="http://www.w3.org/2000/svg">'
+        f'<polyline fill="none" stroke="#1d9bf0" stroke-width="2" points="{points}"/></svg>'
+    )
+
+
+def render_html(store, top_n=10):
+    """
+    Render a static HTML growth report from the summary.
+
+    Args:
+        store (SummaryStore): Materialized summary
+        top_n (int): Number of top movers to chart
+
+    Returns:
+        str: HTML document
+    """
+    esc = html.escape
+    generated = datetime.date.today().isoformat()
+    parts = [
+        '<!DOCTYPE html><html><head><meta charset="utf-8">',
+        '<title>X Followers Report</title>',
+        '<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse}'
+        'td,th{border:1px solid #ddd;padding:4px 8px;text-align:right}'
+        'td:first-child,th:first-child{text-align:left}</style>',
+        '</head><body>',
+        f'<h1>X Followers Report</h1><p>Generated {generated} · {len(store.accounts)} accounts</p>',
+    ]
+
+    monthly = store.monthly_totals()
+    parts.append('<h2>Monthly Totals</h2>')
+    parts.append(_svg_line_chart([m[1] for m in monthly]))
+    parts.append('<table><tr><th>Month</th><th>Delta</th><th>Gained</th><th>Lost</th></tr>')
+    for key, delta, gain, loss in monthly:
+        parts.append(f'<tr><td>{key}</td><td>{delta:+d}</td><td>{gain}</td><td>{loss}</td></tr>')
+    parts.append('</table>')
+
+    parts.append('<h2>Top Movers</h2>')
+    parts.append('<table><tr><th>Account</th><th>Month</th><th>Delta</th><th>Followers</th><th>Trend</th></tr>')
+    for account, key, delta in store.top_movers(top_n):
+        summary = store.accounts[account]
+        trend = [summary['months'][k]['end_count'] for k in sorted(summary['months'])]
+        parts.append(
+            f'<tr><td>@{esc(account)}</td><td>{key}</td><td>{delta:+d}</td>'
+            f'<td>{summary["last_count"]}</td><td>{_svg_line_chart(trend, 160, 40, 4)}</td></tr>'
+        )
+    parts.append('</table>')
+
+    parts.append('<h2>Accounts</h2>')
+    parts.append('<table><tr><th>Account</th><th>Since</th><th>Followers</th>'
+                 '<th>Total Δ</th><th>Gained</th><th>Lost</th></tr>')
+    for account in sorted(store.accounts):
+        summary = store.accounts[account]
+        parts.append(
+            f'<tr><td>@{esc(account)}</td><td>{summary["first_date"]}</td>'
+            f'<td>{summary["last_count"]}</td><td>{summary["total_delta"]:+d}</td>'
+            f'<td>{summary["total_gain"]}</td><td>{summary["total_loss"]}</td></tr>'
+        )
+    parts.append('</table></body></html>')
+    return '\n'.join(parts)
+
+
+def get_summary_store():
+    """
+    Factory function to get the summary store configured from environment.
+
+    Returns:
+        SummaryStore: Configured summary store instance
+    """
+    return SummaryStore(os.getenv('REPORT_SUMMARY_FILE', 'report_summary.json'))
+
+
+def rebuild_summary(store, records, default_account):
+    """
+    Rebuild the summary from a full history (one-off bootstrap).
+
+    Records are sorted first because some backends (Notion) do not return
+    them in date order.
+
+    Args:
+        store (SummaryStore): Summary store to reset and fill
+        records (iterable): Records as yielded by StorageBackend.iter_records
+        default_account (str): Account for records without one
+    """
+    store.accounts = {}
+    rows = sorted(records, key=lambda r: (r.get('account') or default_account, r['date']))
+    for record in rows:
+        delta = record.get('delta') or 0
+        store.update(record.get('account') or default_account, record['date'][:10],
+                     record['followers_count'], delta)
+
+
+def main(argv=None):
+    """
+    Command-line entry point: render the growth report.
+    """
+    parser = argparse.ArgumentParser(description="Render the followers growth report")
+    parser.add_argument('--output', default='report.html', help="Output HTML file (default: report.html)")
+    parser.add_argument('--top', type=int, default=10, help="Number of top movers (default: 10)")
+    parser.add_argument('--rebuild', action='store_true',
+                        help="Rebuild the summary from the storage backend's full history first")
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    store = get_summary_store()
+    if args.rebuild:
+        from storage import get_storage_backend
+        storage = get_storage_backend()
+        rebuild_summary(store, storage.iter_records(), os.getenv('X_USERNAME', 'default'))
+        store.save()
+        print(f"✓ Rebuilt summary for {len(store.accounts)} accounts")
+
+    with open(args.output, 'w') as f:
+        f.write(render_html(store, args.top))
+    print(f"✓ Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
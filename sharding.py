@@ -0,0 +1,304 @@
+"""
+Deterministic sharding of account lists across parallel runners.
+Each runner fetches counts for its shard of accounts; a single merge step
+then writes all shard outputs to the configured backend in one batch.
+"""
+import argparse
+import datetime
+import glob
+import hashlib
+import json
+import os
+from storage import BatchSaveError
+
+
+def _hash64(account):
+    """Stable 64-bit hash of a normalized account name."""
+    digest = hashlib.blake2b(account.lower().encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def jump_hash(key, num_buckets):
+    """
+    Jump consistent hash (Lamping & Veach).
+
+    Growing from N to N+1 buckets moves only ~1/(N+1) of the keys, all of
+    them into the new bucket.
+
+    Args:
+        key (int): 64-bit key
+        num_buckets (int): Number of buckets
+
+    Returns:
+        int: Bucket index in [0, num_buckets)
+    """
+    if num_buckets < 1:
+        raise ValueError("num_buckets must be at least 1")
+
+    b, j = -1, 0
+    while j < num_buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return b
+
+
+def shard_for(account, shard_count):
+    """
+    Get the shard index an account is assigned to.
+
+    Args:
+        account (str): Account name
+        shard_count (int): Total number of shards
+
+    Returns:
+        int: Shard index
+    """
+    return jump_hash(_hash64(account), shard_count)
+
+
+def select_accounts(accounts, shard_index, shard_count):
+    """
+    Filter an account list down to one shard.
+
+    Args:
+        accounts (list): All account names
+        shard_index (int): This runner's shard index
+        shard_count (int): Total number of shards
+
+    Returns:
+        list: Accounts assigned to shard_index
+    """
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"shard_index must be in [0, {shard_count})")
+    return [a for a in accounts if shard_for(a, shard_count) == shard_index]
+
+
+def load_accounts(accounts_file=None):
+    """
+    Load the account list from a file (one per line) or X_USERNAMES.
+
+    Blank lines, '#' comments, leading '@' and case-insensitive duplicates
+    are dropped.
+
+    Args:
+        accounts_file (str): Path to accounts file (optional)
+
+    Returns:
+        list: Account names
+    """
+    if accounts_file:
+        with open(accounts_file, 'r') as f:
+            raw = [line.split('#', 1)[0] for line in f]
+    else:
+        raw = os.getenv('X_USERNAMES', '').split(',')
+
+    accounts = []
+    seen = set()
+    for name in raw:
+        name = name.strip().lstrip('@')
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            accounts.append(name)
+    return accounts
+
+
+def shard_output_path(output_dir, shard_index, shard_count):
+    """Get the output file path for one shard."""
+    return os.path.join(output_dir, f"shard-{shard_index:04d}-of-{shard_count:04d}.jsonl")
+
+
+def run_shard(accounts, shard_index, shard_count, output_dir, fetch=None):
+    """
+    Fetch followers counts for one shard and write them to a JSONL file.
+
+    Args:
+        accounts (list): All account names
+        shard_index (int): This runner's shard index
+        shard_count (int): Total number of shards
+        output_dir (str): Directory for shard outputs
+        fetch (callable): username -> followers count (defaults to X API)
+
+    Returns:
+        str: Path of the written shard output
+    """
+    cache = None
+    if fetch is None:
+        from main import FollowersCache, get_followers_count
+        cache = FollowersCache()
+        fetch = lambda account: get_followers_count(account, cache)
+
+    assigned = select_accounts(accounts, shard_index, shard_count)
+    print(f"✓ Shard {shard_index + 1}/{shard_count}: {len(assigned)} of {len(accounts)} accounts")
+
+    today = datetime.date.today().isoformat()
+    os.makedirs(output_dir, exist_ok=True)
+    path = shard_output_path(output_dir, shard_index, shard_count)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        for account in assigned:
+            try:
+                count = fetch(account)
+            except Exception as e:
+                print(f"✗ Failed to fetch @{account}: {e}")
+                continue
+            f.write(json.dumps({'account': account, 'date': today, 'followers_count': count}) + '\n')
+    os.replace(tmp_path, path)
+
+    if cache is not None:
+        cache.save()
+    return path
+
+
+def read_shard_outputs(input_dir):
+    """
+    Read and deduplicate all shard outputs in a directory.
+
+    Returns:
+        dict: (account, date) -> followers count
+    """
+    observations = {}
+    for path in sorted(glob.glob(os.path.join(input_dir, 'shard-*.jsonl'))):
+        with open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    obs = json.loads(line)
+                    observations[(obs['account'], obs['date'])] = obs['followers_count']
+    return observations
+
+
+def merge_shards(storage, input_dir, bootstrap=False):
+    """
+    Merge shard outputs into the storage backend in one batched write.
+
+    Previous counts come from the report summary, which keeps each
+    account's last date and count, so a merge never reads the backend's
+    history. Accounts already recorded on or after an observation's date
+    are skipped, so re-running the merge does not create duplicate rows.
+
+    Args:
+        storage (StorageBackend): Initialized storage backend
+        input_dir (str): Directory containing shard outputs
+        bootstrap (bool): Rebuild the summary from the backend's full
+            history first (one-off, e.g. when the summary file was lost)
+
+    Returns:
+        list: Records written
+    """
+    from report import get_summary_store, rebuild_summary
+
+    store = get_summary_store()
+    if bootstrap:
+        rebuild_summary(store, storage.iter_records(), os.getenv('X_USERNAME', 'default'))
+        print(f"✓ Rebuilt summary for {len(store.accounts)} accounts")
+
+    observations = read_shard_outputs(input_dir)
+
+    latest = {
+        account: (summary['last_date'], summary['last_count'])
+        for account, summary in store.accounts.items()
+    }
+
+    batch = []
+    first_runs = set()
+    for (account, date), count in sorted(observations.items()):
+        last_date, last_count = latest.get(account, (None, 0))
+        if last_date is not None and last_date >= date:
+            continue
+        delta = count - last_count
+        growth_rate = (delta / last_count * 100) if last_count > 0 else 0.0
+        batch.append({
+            'date': date,
+            'account': account,
+            'followers_count': count,
+            'delta': delta,
+            'rate': growth_rate,
+        })
+        if last_count == 0:
+            first_runs.add((account, date))
+        latest[account] = (date, count)
+
+    if not batch:
+        print("ℹ No new records to merge")
+        if bootstrap:
+            store.save()
+        return batch
+
+    try:
+        storage.save_records(batch)
+    except BatchSaveError as e:
+        # Records that did save will be skipped by the next merge, so fold
+        # them into the detector and summary now before reporting the error
+        _update_state(store, e.saved, first_runs)
+        raise
+    print(f"✓ Merged {len(batch)} records from {input_dir}")
+
+    _update_state(store, batch, first_runs)
+    return batch
+
+
+def _update_state(store, records, first_runs):
+    """
+    Fold saved records into the anomaly detector and report summary.
+
+    The summary doubles as the last (date, count) index for the next merge.
+
+    Args:
+        store (SummaryStore): Report summary
+        records (list): Records written to storage
+        first_runs (set): (account, date) keys with no previous count
+    """
+    from anomaly import get_anomaly_detector
+
+    detector = get_anomaly_detector()
+    for record in records:
+        store.update(record['account'], record['date'], record['followers_count'], record['delta'])
+        if (record['account'], record['date']) not in first_runs:
+            result = detector.update(record['account'], record['delta'], record['date'])
+            if result and result['anomaly']:
+                print(f"⚠ Anomaly detected for @{record['account']}: Δ{record['delta']:+d} "
+                      f"(z={result['zscore']:+.1f})")
+    detector.save()
+    store.save()
+
+
+def main(argv=None):
+    """
+    Command-line entry point: run one shard or merge shard outputs.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Sharded multi-account followers tracking")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Fetch counts for one shard")
+    run_parser.add_argument('--shard-index', type=int, default=int(os.getenv('SHARD_INDEX', '0')))
+    run_parser.add_argument('--shard-count', type=int, default=int(os.getenv('SHARD_COUNT', '1')))
+    run_parser.add_argument('--accounts-file', default=os.getenv('ACCOUNTS_FILE'))
+    run_parser.add_argument('--output-dir', default='shards')
+
+    merge_parser = subparsers.add_parser('merge', help="Write all shard outputs to the storage backend")
+    merge_parser.add_argument('--input-dir', default='shards')
+    merge_parser.add_argument('--bootstrap', action='store_true',
+                              help="Rebuild the last-count index from the backend's full history first")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        accounts = load_accounts(args.accounts_file)
+        if not accounts:
+            print("✗ Error: No accounts configured")
+            print("  Please set X_USERNAMES or ACCOUNTS_FILE")
+            return
+        path = run_shard(accounts, args.shard_index, args.shard_count, args.output_dir)
+        print(f"✓ Shard output written to {path}")
+    else:
+        from storage import get_storage_backend
+        storage = get_storage_backend()
+        storage.initialize()
+        merge_shards(storage, args.input_dir, args.bootstrap)
+
+
+if __name__ == "__main__":
+    main()
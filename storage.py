@@ -5,8 +5,116 @@ Supports CSV (local file), Google Sheets (online), and Notion (database).
 import csv
 import os
 import datetime
+import threading
+import time
 from abc import ABC, abstractmethod
 
+HEADER = ['date', 'followers_count', 'delta', 'rate', 'account']
+
+# Header written before multi-account support; upgraded in place on initialize
+LEGACY_HEADER = HEADER[:4]
+
+
+def parse_rate(value):
+    """
+    Parse a stored growth rate string such as "+1.30%" into a float.
+
+    Args:
+        value (str): Rate as written by the backends
+
+    Returns:
+        float: Growth percentage, or None if the value is empty
+    """
+    value = (value or '').strip().rstrip('%')
+    if not value:
+        return None
+    return float(value)
+
+
+def _format_row(date, current_count, delta, growth_rate, account=None):
+    """
+    Build a [date, followers_count, delta, rate, account] row.
+
+    The account column is left empty in single-account mode.
+
+    Returns:
+        list: Row as written to CSV and Google Sheets
+    """
+    return [date, current_count, delta, f"{growth_rate:.2f}%", account or '']
+
+
+def _batch_rows(batch):
+    """Format a batch of record dicts as rows, defaulting dates to today."""
+    today = datetime.date.today().isoformat()
+    return [
+        _format_row(record.get('date') or today, record['followers_count'], record['delta'],
+                    record['rate'], record.get('account'))
+        for record in batch
+    ]
+
+
+def _label(account):
+    """Format an optional account prefix for log messages."""
+    return f"@{account}, " if account else ""
+
+
+def _row_account(row):
+    """Get the account column of a raw row, or None for single-account rows."""
+    return row[4] if len(row) > 4 and row[4] else None
+
+
+def _parse_row(row):
+    """
+    Convert a raw [date, followers_count, delta, rate, account?] row to a record.
+
+    Returns:
+        dict: Typed record with date, followers_count, delta, rate and account
+    """
+    return {
+        'date': row[0],
+        'followers_count': int(row[1]),
+        'delta': int(row[2]) if len(row) > 2 and row[2] != '' else None,
+        'rate': parse_rate(row[3]) if len(row) > 3 else None,
+        'account': _row_account(row),
+    }
+
+
+class BatchSaveError(Exception):
+    """Raised when only part of a batch could be saved."""
+
+    def __init__(self, message, saved, failed):
+        """
+        Args:
+            message (str): Error description
+            saved (list): Records that were saved
+            failed (list): (record, exception) pairs that were not
+        """
+        super().__init__(message)
+        self.saved = saved
+        self.failed = failed
+
+
+class _RateLimiter:
+    """Thread-safe limiter spacing calls evenly at a maximum rate."""
+
+    def __init__(self, rate):
+        """
+        Args:
+            rate (float): Maximum calls per second
+        """
+        self.interval = 1.0 / rate
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next call slot is available."""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_time)
+            self.next_time = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
@@ -17,17 +125,24 @@ class StorageBackend(ABC):
         pass
 
     @abstractmethod
-    def load_last_record(self):
+    def load_last_record(self, account=None):
         """
         Load the last recorded followers count.
 
+        Multi-account rows are kept apart from single-account ones: only rows
+        whose account matches are considered (rows without one when account
+        is None).
+
+        Args:
+            account (str): Account identifier, or None for single-account mode
+
         Returns:
             int: Last followers count, or 0 if no history
         """
         pass
 
     @abstractmethod
-    def save_record(self, current_count, delta, growth_rate):
+    def save_record(self, current_count, delta, growth_rate, date=None, account=None):
         """
         Save a new record.
 
@@ -35,6 +150,32 @@ class StorageBackend(ABC):
             current_count (int): Current followers count
             delta (int): Change from previous count
             growth_rate (float): Growth percentage
+            date (str): Record date (YYYY-MM-DD), defaults to today
+            account (str): Account identifier for multi-account logs (optional)
+        """
+        pass
+
+    @abstractmethod
+    def save_records(self, batch):
+        """
+        Save several records with as few backend calls as possible.
+
+        Args:
+            batch (list): Records as dicts with followers_count, delta, rate
+                and optional date and account
+
+        Raises:
+            BatchSaveError: If only some records were saved
+        """
+        pass
+
+    @abstractmethod
+    def iter_records(self):
+        """
+        Stream all stored records, one at a time.
+
+        Yields:
+            dict: Record with date, followers_count, delta, rate and account
         """
         pass
 
@@ -52,23 +193,45 @@ class CSVStorage(StorageBackend):
         self.file_path = file_path
 
     def initialize(self):
-        """Create CSV file with header if it doesn't exist."""
+        """Create CSV file with header if it doesn't exist, upgrading legacy headers."""
         if not os.path.exists(self.file_path):
             with open(self.file_path, 'w', newline='') as f:
                 writer = csv.writer(f)
-                writer.writerow(['date', 'followers_count', 'delta', 'rate'])
+                writer.writerow(HEADER)
             print(f"✓ Created new CSV file: {self.file_path}")
-
-    def load_last_record(self):
-        """Load last record from CSV file."""
+            return
+
+        with open(self.file_path, 'r', newline='') as f:
+            header = next(csv.reader(f), None)
+        if header == LEGACY_HEADER:
+            self._upgrade_header()
+        elif header != HEADER:
+            print("⚠ Warning: CSV header doesn't match expected format")
+
+    def _upgrade_header(self):
+        """Rewrite a 4-column header to include the account column (rows are kept as-is)."""
+        tmp_path = f"{self.file_path}.tmp"
+        with open(self.file_path, 'r', newline='') as src, open(tmp_path, 'w', newline='') as dst:
+            src.readline()  # Drop old header
+            csv.writer(dst).writerow(HEADER)
+            for line in src:
+                dst.write(line)
+        os.replace(tmp_path, self.file_path)
+        print(f"✓ Added account column to CSV header: {self.file_path}")
+
+    def load_last_record(self, account=None):
+        """Load last record for the account from CSV file."""
         try:
             with open(self.file_path, 'r') as f:
                 reader = csv.reader(f)
-                rows = list(reader)
-                if len(rows) > 1:  # Has data beyond header
-                    last_row = rows[-1]
+                next(reader, None)  # Skip header
+                last_row = None
+                for row in reader:
+                    if row and _row_account(row) == account:
+                        last_row = row
+                if last_row:
                     last_count = int(last_row[1])
-                    print(f"✓ Loaded last record: {last_count} followers on {last_row[0]}")
+                    print(f"✓ Loaded last record: {_label(account)}{last_count} followers on {last_row[0]}")
                     return last_count
                 else:
                     print("ℹ No historical data found (first run)")
@@ -77,18 +240,43 @@ class CSVStorage(StorageBackend):
             print("ℹ No CSV file found (first run)")
             return 0
 
-    def save_record(self, current_count, delta, growth_rate):
+    def save_record(self, current_count, delta, growth_rate, date=None, account=None):
         """Append record to CSV file."""
-        today = datetime.date.today().isoformat()
+        today = date or datetime.date.today().isoformat()
+        with open(self.file_path, 'a', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(_format_row(today, current_count, delta, growth_rate, account))
+        print(f"✓ Saved record: {today}, {_label(account)}{current_count} followers, Δ{delta:+d} ({growth_rate:+.2f}%)")
+
+    def save_records(self, batch):
+        """Append a batch of records to CSV file in a single write."""
+        if not batch:
+            return
         with open(self.file_path, 'a', newline='') as f:
             writer = csv.writer(f)
-            writer.writerow([today, current_count, delta, f"{growth_rate:.2f}%"])
-        print(f"✓ Saved record: {today}, {current_count} followers, Δ{delta:+d} ({growth_rate:+.2f}%)")
+            writer.writerows(_batch_rows(batch))
+        print(f"✓ Saved {len(batch)} records to {self.file_path}")
+
+    def iter_records(self):
+        """Stream records from CSV file without loading it into memory."""
+        try:
+            f = open(self.file_path, 'r', newline='')
+        except FileNotFoundError:
+            return
+        with f:
+            reader = csv.reader(f)
+            next(reader, None)  # Skip header
+            for row in reader:
+                if row:
+                    yield _parse_row(row)
 
 
 class SheetsStorage(StorageBackend):
     """Google Sheets storage backend."""
 
+    # Rows fetched per request when streaming records
+    PAGE_SIZE = 1000
+
     def __init__(self, spreadsheet_id, credentials_json):
         """
         Initialize Google Sheets storage.
@@ -140,51 +328,93 @@ class SheetsStorage(StorageBackend):
         values = self.worksheet.get_all_values()
         if not values or len(values) == 0:
             # Add header
-            self.worksheet.append_row(['date', 'followers_count', 'delta', 'rate'])
+            self.worksheet.append_row(HEADER)
             print("✓ Initialized Google Sheets with header")
-        elif values[0] != ['date', 'followers_count', 'delta', 'rate']:
+        elif values[0] == LEGACY_HEADER:
+            # Upgrade header written before multi-account support
+            self.worksheet.update_cell(1, len(HEADER), HEADER[-1])
+            print("✓ Added account column to Google Sheets header")
+        elif values[0] != HEADER:
             # Verify header
             print("⚠ Warning: Sheet header doesn't match expected format")
 
-    def load_last_record(self):
-        """Load last record from Google Sheets."""
+    def load_last_record(self, account=None):
+        """Load last record for the account from Google Sheets."""
         if not self.worksheet:
             raise Exception("Not connected to Google Sheets")
 
         values = self.worksheet.get_all_values()
-        if len(values) > 1:  # Has data beyond header
-            last_row = values[-1]
+        matching = [row for row in values[1:] if row and _row_account(row) == account]
+        if matching:
+            last_row = matching[-1]
             last_count = int(last_row[1])
-            print(f"✓ Loaded last record: {last_count} followers on {last_row[0]}")
+            print(f"✓ Loaded last record: {_label(account)}{last_count} followers on {last_row[0]}")
             return last_count
         else:
             print("ℹ No historical data found (first run)")
             return 0
 
-    def save_record(self, current_count, delta, growth_rate):
+    def save_record(self, current_count, delta, growth_rate, date=None, account=None):
         """Append record to Google Sheets."""
         if not self.worksheet:
             raise Exception("Not connected to Google Sheets")
 
-        today = datetime.date.today().isoformat()
-        row = [today, current_count, delta, f"{growth_rate:.2f}%"]
+        today = date or datetime.date.today().isoformat()
+        row = _format_row(today, current_count, delta, growth_rate, account)
         self.worksheet.append_row(row)
-        print(f"✓ Saved record to Sheets: {today}, {current_count} followers, Δ{delta:+d} ({growth_rate:+.2f}%)")
+        print(f"✓ Saved record to Sheets: {today}, {_label(account)}{current_count} followers, Δ{delta:+d} ({growth_rate:+.2f}%)")
+
+    def save_records(self, batch):
+        """Append a batch of records to Google Sheets in one request."""
+        if not self.worksheet:
+            raise Exception("Not connected to Google Sheets")
+        if not batch:
+            return
+
+        self.worksheet.append_rows(_batch_rows(batch))
+        print(f"✓ Saved {len(batch)} records to Sheets")
+
+    def iter_records(self):
+        """Stream records from Google Sheets one page of rows at a time."""
+        if not self.worksheet:
+            raise Exception("Not connected to Google Sheets")
+
+        start = 2  # Skip header
+        while True:
+            end = start + self.PAGE_SIZE - 1
+            rows = self.worksheet.get(f"A{start}:E{end}")
+            for row in rows:
+                if row:
+                    yield _parse_row(row)
+            if len(rows) < self.PAGE_SIZE:
+                break
+            start = end + 1
 
 
 class NotionStorage(StorageBackend):
     """Notion database storage backend."""
 
-    def __init__(self, token, database_id):
+    # Retries per page when Notion answers with a rate-limit error
+    MAX_RETRIES = 3
+
+    # Base delay in seconds for exponential backoff between retries
+    RETRY_BACKOFF = 1.0
+
+    def __init__(self, token, database_id, max_workers=3, requests_per_second=3.0):
         """
         Initialize Notion storage.
 
         Args:
             token (str): Notion Integration Token
             database_id (str): Notion Database ID
+            max_workers (int): Concurrent requests for batch saves
+            requests_per_second (float): Request rate cap for batch saves
+                (Notion allows an average of 3 requests per second)
         """
         self.token = token.strip() if token else token
         self.database_id = database_id.strip() if database_id else database_id
+        self.max_workers = max_workers
+        self._rate_limiter = _RateLimiter(requests_per_second)
         self.client = None
         self._connect()
 
@@ -219,8 +449,18 @@ class NotionStorage(StorageBackend):
         except Exception as e:
             raise Exception(f"Failed to verify Notion database: {e}")
 
-    def load_last_record(self):
-        """Load last record from Notion database (excluding today's records)."""
+    def _is_database_page(self, page):
+        """Check whether a search result page belongs to our database."""
+        parent = page.get('parent', {})
+        parent_type = parent.get('type')
+        # In Notion API 2025, type changed from 'database_id' to 'data_source_id'
+        if parent_type in ['database_id', 'data_source_id']:
+            parent_db_id = parent.get('database_id') or parent.get('data_source_id')
+            return parent_db_id == self.database_id
+        return False
+
+    def load_last_record(self, account=None):
+        """Load last record for the account from Notion database (excluding today's records)."""
         if not self.client:
             raise Exception("Not connected to Notion")
 
@@ -228,49 +468,44 @@ class NotionStorage(StorageBackend):
             # Get today's date to exclude today's records
             today = datetime.date.today().isoformat()
 
-            # Use search API to find all pages
+            # Use search API to find all pages, most recently edited first
             # Note: In newer Notion API, we use search instead of database query
-            response = self.client.search(
-                filter={
-                    "property": "object",
-                    "value": "page"
-                },
-                sort={
-                    "direction": "descending",
-                    "timestamp": "last_edited_time"
-                },
-                page_size=100  # Get more pages to filter by database
-            )
-
-            results = response.get('results', [])
-
-            # Filter pages that belong to our database and have Date property
-            database_pages = []
-            for page in results:
-                # Check if page belongs to our database
-                parent = page.get('parent', {})
-                parent_type = parent.get('type')
-                # In Notion API 2025, type changed from 'database_id' to 'data_source_id'
-                if parent_type in ['database_id', 'data_source_id']:
-                    parent_db_id = parent.get('database_id') or parent.get('data_source_id')
-                    if parent_db_id == self.database_id:
-                        database_pages.append(page)
-
-            if not database_pages:
-                print("ℹ No historical data found in Notion (first run)")
-                return 0
-
-            # Sort pages by Date property and filter out today's records
             dated_pages = []
-            for page in database_pages:
-                properties = page.get('properties', {})
-                date_property = properties.get('Date', {})
-                date_obj = date_property.get('date', {})
-                if date_obj and date_obj.get('start'):
-                    record_date = date_obj.get('start')
-                    # Only include records from before today
-                    if record_date < today:
-                        dated_pages.append((page, record_date))
+            start_cursor = None
+            while True:
+                kwargs = {
+                    "filter": {
+                        "property": "object",
+                        "value": "page"
+                    },
+                    "sort": {
+                        "direction": "descending",
+                        "timestamp": "last_edited_time"
+                    },
+                    "page_size": 100  # Get more pages to filter by database
+                }
+                if start_cursor:
+                    kwargs["start_cursor"] = start_cursor
+                response = self.client.search(**kwargs)
+
+                for page in response.get('results', []):
+                    # Only pages of our database for this account (rows of other
+                    # accounts from sharded runs may share the database)
+                    if not self._is_database_page(page) or self._page_account(page) != account:
+                        continue
+                    properties = page.get('properties', {})
+                    date_property = properties.get('Date', {})
+                    date_obj = date_property.get('date', {})
+                    if date_obj and date_obj.get('start'):
+                        record_date = date_obj.get('start')
+                        # Only include records from before today
+                        if record_date < today:
+                            dated_pages.append((page, record_date))
+
+                # Stop at the first result page that had matching records
+                if dated_pages or not response.get('has_more'):
+                    break
+                start_cursor = response.get('next_cursor')
 
             if not dated_pages:
                 print("ℹ No historical data found in Notion (first run)")
@@ -292,46 +527,164 @@ class NotionStorage(StorageBackend):
             print(f"⚠ Error loading last record from Notion: {e}")
             return 0
 
-    def save_record(self, current_count, delta, growth_rate):
+    @staticmethod
+    def _record_properties(date, current_count, delta, growth_rate, account=None):
+        """Build Notion page properties for a record."""
+        properties = {
+            "Date": {
+                "date": {
+                    "start": date
+                }
+            },
+            "Followers Count": {
+                "number": current_count
+            },
+            "Delta": {
+                "number": delta
+            },
+            "Rate": {
+                "rich_text": [
+                    {
+                        "text": {
+                            "content": f"{growth_rate:.2f}%"
+                        }
+                    }
+                ]
+            }
+        }
+        # Multi-account databases need an extra "Account" Text property
+        if account:
+            properties["Account"] = {
+                "rich_text": [
+                    {
+                        "text": {
+                            "content": account
+                        }
+                    }
+                ]
+            }
+        return properties
+
+    def save_record(self, current_count, delta, growth_rate, date=None, account=None):
         """Create new page in Notion database."""
         if not self.client:
             raise Exception("Not connected to Notion")
 
-        today = datetime.date.today().isoformat()
+        today = date or datetime.date.today().isoformat()
 
         try:
             # Create new page with properties
             self.client.pages.create(
                 parent={"database_id": self.database_id},
-                properties={
-                    "Date": {
-                        "date": {
-                            "start": today
-                        }
-                    },
-                    "Followers Count": {
-                        "number": current_count
-                    },
-                    "Delta": {
-                        "number": delta
-                    },
-                    "Rate": {
-                        "rich_text": [
-                            {
-                                "text": {
-                                    "content": f"{growth_rate:.2f}%"
-                                }
-                            }
-                        ]
-                    }
-                }
+                properties=self._record_properties(today, current_count, delta, growth_rate, account)
             )
 
-            print(f"✓ Saved record to Notion: {today}, {current_count} followers, Δ{delta:+d} ({growth_rate:+.2f}%)")
+            print(f"✓ Saved record to Notion: {today}, {_label(account)}{current_count} followers, Δ{delta:+d} ({growth_rate:+.2f}%)")
 
         except Exception as e:
             raise Exception(f"Failed to save record to Notion: {e}")
 
+    def _create_page(self, record, today):
+        """Create one page, retrying when Notion reports rate limiting."""
+        properties = self._record_properties(
+            record.get('date') or today, record['followers_count'], record['delta'],
+            record['rate'], record.get('account')
+        )
+        for attempt in range(self.MAX_RETRIES):
+            self._rate_limiter.wait()
+            try:
+                return self.client.pages.create(
+                    parent={"database_id": self.database_id},
+                    properties=properties
+                )
+            except Exception as e:
+                rate_limited = getattr(e, 'code', None) == 'rate_limited' or getattr(e, 'status', None) == 429
+                if not rate_limited or attempt == self.MAX_RETRIES - 1:
+                    raise
+                time.sleep(self.RETRY_BACKOFF * 2 ** attempt)  # Back off before retry
+
+    def save_records(self, batch):
+        """Create pages for a batch of records using a rate-limited worker pool."""
+        if not self.client:
+            raise Exception("Not connected to Notion")
+        if not batch:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        today = datetime.date.today().isoformat()
+        saved = []
+        failures = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(self._create_page, record, today) for record in batch]
+            for record, future in zip(batch, futures):
+                try:
+                    future.result()
+                    saved.append(record)
+                except Exception as e:
+                    failures.append((record, e))
+
+        print(f"✓ Saved {len(saved)} records to Notion")
+        if failures:
+            record, error = failures[0]
+            raise BatchSaveError(
+                f"Failed to save {len(failures)} of {len(batch)} records to Notion "
+                f"(first: {_label(record.get('account'))}{record.get('date') or today}: {error})",
+                saved, failures
+            )
+
+    def iter_records(self):
+        """Stream records from Notion, following search pagination cursors."""
+        if not self.client:
+            raise Exception("Not connected to Notion")
+
+        start_cursor = None
+        while True:
+            kwargs = {
+                "filter": {
+                    "property": "object",
+                    "value": "page"
+                },
+                "page_size": 100
+            }
+            if start_cursor:
+                kwargs["start_cursor"] = start_cursor
+            response = self.client.search(**kwargs)
+
+            for page in response.get('results', []):
+                if not self._is_database_page(page):
+                    continue
+                record = self._page_to_record(page)
+                if record:
+                    yield record
+
+            if not response.get('has_more'):
+                break
+            start_cursor = response.get('next_cursor')
+
+    @staticmethod
+    def _page_account(page):
+        """Get the Account property of a page, or None if unset."""
+        account_text = page.get('properties', {}).get('Account', {}).get('rich_text', [])
+        return (account_text[0].get('plain_text') or None) if account_text else None
+
+    @staticmethod
+    def _page_to_record(page):
+        """Convert a Notion page into a record, or None if it has no date."""
+        properties = page.get('properties', {})
+        date_obj = properties.get('Date', {}).get('date') or {}
+        if not date_obj.get('start'):
+            return None
+
+        rate_text = properties.get('Rate', {}).get('rich_text', [])
+        return {
+            'date': date_obj['start'][:10],
+            'followers_count': properties.get('Followers Count', {}).get('number') or 0,
+            'delta': properties.get('Delta', {}).get('number'),
+            'rate': parse_rate(rate_text[0].get('plain_text', '')) if rate_text else None,
+            'account': NotionStorage._page_account(page),
+        }
+
 
 def get_storage_backend():
     """
@@ -352,8 +705,10 @@ def get_storage_backend():
                 "environment variables"
             )
 
+        max_workers = int(os.getenv('NOTION_MAX_WORKERS', '3'))
+
         print("📝 Using Notion storage")
-        return NotionStorage(token, database_id)
+        return NotionStorage(token, database_id, max_workers=max_workers)
 
     elif storage_type == 'sheets':
         spreadsheet_id = os.getenv('GOOGLE_SHEETS_ID')
@@ -0,0 +1,179 @@
+"""
+Test script for streaming anomaly detection
+Tests EWMA scoring, warmup and state persistence
+"""
+import os
+import sys
+from anomaly import AnomalyDetector
+
+test_state_file = 'test_anomaly_state.json'
+
+
+def _cleanup():
+    if os.path.exists(test_state_file):
+        os.remove(test_state_file)
+
+
+def test_flags_spike():
+    """Test that a sudden spike is flagged after warmup"""
+    print("\n" + "=" * 60)
+    print("Test: Spike Detection")
+    print("=" * 60)
+
+    _cleanup()
+    detector = AnomalyDetector(test_state_file, warmup=5)
+
+    # Normal growth of roughly +10/day
+    deltas = [10, 12, 9, 11, 10, 8, 12, 10]
+    for day, delta in enumerate(deltas, start=1):
+        result = detector.update('alice', delta, f"2025-11-{day:02d}")
+        assert not result['anomaly'], f"Delta {delta} should not be anomalous"
+    print("   ✓ Normal growth not flagged")
+
+    result = detector.update('alice', 500, '2025-11-09')
+    assert result['anomaly'], "Viral spike should be flagged"
+    print(f"   ✓ Spike flagged (z={result['zscore']:+.1f})")
+
+    result = detector.update('alice', -400, '2025-11-10')
+    assert result['anomaly'], "Bot purge should be flagged"
+    print(f"   ✓ Purge flagged (z={result['zscore']:+.1f})")
+
+    result = detector.update('alice', 11, '2025-11-11')
+    assert not result['anomaly'], "Baseline should survive the outliers"
+    print("   ✓ Baseline not inflated by outliers")
+
+    print("\n✓ Spike detection test passed")
+    return True
+
+
+def test_warmup():
+    """Test that nothing is flagged during warmup"""
+    print("\n" + "=" * 60)
+    print("Test: Warmup")
+    print("=" * 60)
+
+    _cleanup()
+    detector = AnomalyDetector(test_state_file, warmup=3)
+    for day, delta in enumerate([1, 1000, -1000], start=1):
+        result = detector.update('bob', delta, f"2025-11-{day:02d}")
+        assert not result['anomaly'] and result['zscore'] is None, "No scoring during warmup"
+    print("   ✓ No flags during warmup")
+
+    print("\n✓ Warmup test passed")
+    return True
+
+
+def test_same_day_rerun():
+    """Test that a same-day rerun does not add a second observation"""
+    print("\n" + "=" * 60)
+    print("Test: Same-Day Rerun")
+    print("=" * 60)
+
+    _cleanup()
+    detector = AnomalyDetector(test_state_file)
+    detector.update('alice', 10, '2025-11-01')
+    state = dict(detector.accounts['alice'])
+
+    assert detector.update('alice', 0, '2025-11-01') is None, "Same date should be ignored"
+    assert detector.update('alice', 10, '2025-10-31') is None, "Older date should be ignored"
+    assert detector.accounts['alice'] == state, "State should be unchanged"
+    print("   ✓ Repeated dates ignored")
+
+    print("\n✓ Same-day rerun test passed")
+    return True
+
+
+def test_skipped_days():
+    """Test that a delta spanning missed runs is scored per day"""
+    print("\n" + "=" * 60)
+    print("Test: Skipped Scheduled Runs")
+    print("=" * 60)
+
+    _cleanup()
+    detector = AnomalyDetector(test_state_file, warmup=5)
+    deltas = [10, 12, 9, 11, 10, 8, 12, 10]
+    for day, delta in enumerate(deltas, start=1):
+        detector.update('alice', delta, f"2025-11-{day:02d}")
+
+    # Runs on 11-09 and 11-10 were skipped: +31 over three days is normal growth
+    result = detector.update('alice', 31, '2025-11-11')
+    assert result['days'] == 3, f"Expected 3 days, got {result['days']}"
+    assert not result['anomaly'], f"Multi-day delta flagged (z={result['zscore']:+.1f})"
+    print(f"   ✓ +31 over 3 days not flagged (z={result['zscore']:+.1f})")
+
+    # A real spike is still caught across a gap
+    result = detector.update('alice', 600, '2025-11-13')
+    assert result['days'] == 2 and result['anomaly'], "Spike across a gap should be flagged"
+    print(f"   ✓ +600 over 2 days flagged (z={result['zscore']:+.1f})")
+
+    print("\n✓ Skipped scheduled runs test passed")
+    return True
+
+
+def test_state_persistence():
+    """Test that per-account state survives between runs"""
+    print("\n" + "=" * 60)
+    print("Test: State Persistence")
+    print("=" * 60)
+
+    _cleanup()
+    detector = AnomalyDetector(test_state_file)
+    for day, delta in enumerate([5, 6, 7], start=1):
+        detector.update('alice', delta, f"2025-11-{day:02d}")
+    detector.update('bob', 100, '2025-11-01')
+    detector.save()
+
+    reloaded = AnomalyDetector(test_state_file)
+    assert set(reloaded.accounts) == {'alice', 'bob'}, "Both accounts should persist"
+    assert reloaded.accounts['alice']['n'] == 3, "Observation count should persist"
+    assert reloaded.accounts['alice'] == detector.accounts['alice'], "State should round-trip"
+    print("   ✓ State round-trips through file")
+
+    _cleanup()
+    print("\n✓ State persistence test passed")
+    return True
+
+
+def run_all_tests():
+    """Run all anomaly detection tests"""
+    print("=" * 60)
+    print("Anomaly Detection - Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_flags_spike,
+        test_warmup,
+        test_same_day_rerun,
+        test_skipped_days,
+        test_state_persistence
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+
+    _cleanup()
+
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+    print(f"  Passed: {passed}/{len(tests)}")
+    print(f"  Failed: {failed}/{len(tests)}")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
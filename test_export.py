@@ -0,0 +1,133 @@
+"""
+Test script for Parquet/Arrow export
+Round-trip tests run only when pyarrow is installed
+"""
+import os
+import sys
+from export import export_records, infer_format, iter_batches
+
+
+def _make_records(count):
+    """Generate mock records"""
+    for i in range(count):
+        yield {
+            'date': f"2025-11-{(i % 28) + 1:02d}",
+            'followers_count': 1000 + i,
+            'delta': 1,
+            'rate': 0.1,
+            'account': 'alice' if i % 2 else None,
+        }
+
+
+def test_iter_batches():
+    """Test batching of record streams"""
+    print("\n" + "=" * 60)
+    print("Test: Record Batching")
+    print("=" * 60)
+
+    sizes = [len(batch) for batch in iter_batches(_make_records(25), batch_size=10)]
+    assert sizes == [10, 10, 5], f"Expected [10, 10, 5], got {sizes}"
+    print(f"   ✓ Batch sizes: {sizes}")
+
+    try:
+        list(iter_batches(_make_records(1), batch_size=0))
+        print("   ✗ Should have raised ValueError")
+        return False
+    except ValueError:
+        print("   ✓ Rejects batch_size=0")
+
+    print("\n✓ Record batching test passed")
+    return True
+
+
+def test_infer_format():
+    """Test output format inference"""
+    print("\n" + "=" * 60)
+    print("Test: Format Inference")
+    print("=" * 60)
+
+    assert infer_format('history.parquet') == 'parquet'
+    assert infer_format('history.arrow') == 'arrow'
+    assert infer_format('history.feather') == 'arrow'
+    assert infer_format('history.out') == 'parquet'
+    print("   ✓ Formats inferred from extension")
+
+    print("\n✓ Format inference test passed")
+    return True
+
+
+def test_export_round_trip():
+    """Test Parquet and Arrow export round trip"""
+    print("\n" + "=" * 60)
+    print("Test: Export Round Trip")
+    print("=" * 60)
+
+    try:
+        import pyarrow.parquet as pq
+        import pyarrow.ipc
+    except ImportError:
+        print("   ℹ pyarrow not installed, skipping")
+        return True
+
+    for fmt, path in (('parquet', 'test_export.parquet'), ('arrow', 'test_export.arrow')):
+        total = export_records(_make_records(25), path, fmt, batch_size=10, default_account='bob')
+        assert total == 25, f"Expected 25 records, got {total}"
+
+        if fmt == 'parquet':
+            parquet_file = pq.ParquetFile(path)
+            assert parquet_file.num_row_groups == 3, "Expected one row group per batch"
+            table = parquet_file.read()
+        else:
+            table = pyarrow.ipc.open_file(path).read_all()
+
+        assert table.num_rows == 25
+        assert str(table.schema.field('date').type) == 'date32[day]'
+        assert table.column('followers_count').to_pylist()[-1] == 1024
+        assert table.column('account').to_pylist()[:2] == ['bob', 'alice'], \
+            "Single-account rows should be attributed to default_account"
+        print(f"   ✓ {fmt}: {table.num_rows} rows")
+        os.remove(path)
+
+    print("\n✓ Export round trip test passed")
+    return True
+
+
+def run_all_tests():
+    """Run all export tests"""
+    print("=" * 60)
+    print("Export - Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_iter_batches,
+        test_infer_format,
+        test_export_round_trip
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+    print(f"  Passed: {passed}/{len(tests)}")
+    print(f"  Failed: {failed}/{len(tests)}")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,104 @@
+"""
+Test script for the built-in profiling mode
+Tests report and collapsed-stack generation on a synthetic workload
+"""
+import os
+import sys
+from profiling import run_profiled
+
+test_report_file = 'test_profile_report.txt'
+test_collapsed_file = 'test_profile.collapsed'
+
+
+def _cleanup():
+    for path in (test_report_file, test_collapsed_file):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _allocate():
+    return [str(i) * 10 for i in range(50000)]
+
+
+def _parse(rows):
+    return sum(len(row) for row in rows)
+
+
+def _workload():
+    rows = _allocate()
+    return _parse(rows)
+
+
+def test_profile_report():
+    """Test that the report lists hot functions and allocation sites"""
+    print("\n" + "=" * 60)
+    print("Test: Profile Report")
+    print("=" * 60)
+
+    _cleanup()
+    result = run_profiled(_workload, test_report_file, test_collapsed_file)
+    assert result == _workload(), "Return value should pass through"
+    print("   ✓ Return value passed through")
+
+    with open(test_report_file, 'r') as f:
+        report = f.read()
+    assert 'Peak memory' in report, "Report should include peak memory"
+    assert '_allocate' in report, "Report should list hot functions"
+    assert 'test_profiling.py' in report.split('allocation sites at peak')[1], \
+        "Report should list allocation sites"
+    print("   ✓ Hot functions and allocation sites reported")
+
+    with open(test_collapsed_file, 'r') as f:
+        lines = f.read().splitlines()
+    assert lines, "Collapsed output should not be empty"
+    for line in lines:
+        stack, value = line.rsplit(' ', 1)
+        assert int(value) > 0, "Each stack should have a positive sample value"
+    assert any('_workload' in line and '_allocate' in line for line in lines), \
+        "Collapsed stacks should nest callees under callers"
+    print("   ✓ Collapsed stacks written")
+
+    _cleanup()
+    print("\n✓ Profile report test passed")
+    return True
+
+
+def run_all_tests():
+    """Run all profiling tests"""
+    print("=" * 60)
+    print("Profiling - Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_profile_report
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+
+    _cleanup()
+
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+    print(f"  Passed: {passed}/{len(tests)}")
+    print(f"  Failed: {failed}/{len(tests)}")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,147 @@
+"""
+Test script for incremental report summary
+Tests monthly aggregation, idempotent updates and HTML rendering
+"""
+import os
+import sys
+from report import SummaryStore, rebuild_summary, render_html
+
+test_summary_file = 'test_report_summary.json'
+
+
+def _cleanup():
+    if os.path.exists(test_summary_file):
+        os.remove(test_summary_file)
+
+
+def test_incremental_update():
+    """Test monthly aggregates and running totals"""
+    print("\n" + "=" * 60)
+    print("Test: Incremental Summary Update")
+    print("=" * 60)
+
+    _cleanup()
+    store = SummaryStore(test_summary_file)
+
+    # First record is the baseline, not growth
+    store.update('alice', '2025-10-31', 1234, 1234)
+    store.update('alice', '2025-11-01', 1250, 16)
+    store.update('alice', '2025-11-02', 1240, -10)
+
+    summary = store.accounts['alice']
+    assert summary['total_delta'] == 6, f"Expected total +6, got {summary['total_delta']}"
+    assert summary['total_gain'] == 16 and summary['total_loss'] == 10, "Gain/loss incorrect"
+    november = summary['months']['2025-11']
+    assert november['start_count'] == 1234, f"Expected start 1234, got {november['start_count']}"
+    assert november['end_count'] == 1240, f"Expected end 1240, got {november['end_count']}"
+    assert november['delta'] == 6 and november['days'] == 2, "November aggregate incorrect"
+    print("   ✓ Monthly aggregates and running totals correct")
+
+    # Same-day rerun does not double count
+    assert not store.update('alice', '2025-11-02', 1240, -10), "Duplicate date should be ignored"
+    assert store.accounts['alice']['total_delta'] == 6, "Total should be unchanged"
+    print("   ✓ Duplicate dates ignored")
+
+    store.save()
+    reloaded = SummaryStore(test_summary_file)
+    assert reloaded.accounts == store.accounts, "Summary should round-trip"
+    print("   ✓ Summary persisted")
+
+    _cleanup()
+    print("\n✓ Incremental summary test passed")
+    return True
+
+
+def test_rebuild_matches_incremental():
+    """Test that rebuilding from history matches incremental updates"""
+    print("\n" + "=" * 60)
+    print("Test: Rebuild From History")
+    print("=" * 60)
+
+    records = [
+        {'date': '2025-11-02', 'followers_count': 1240, 'delta': -10, 'account': None},
+        {'date': '2025-10-31', 'followers_count': 1234, 'delta': 1234, 'account': None},
+        {'date': '2025-11-01', 'followers_count': 1250, 'delta': 16, 'account': None},
+    ]
+
+    incremental = SummaryStore(test_summary_file)
+    for record in sorted(records, key=lambda r: r['date']):
+        incremental.update('alice', record['date'], record['followers_count'], record['delta'])
+
+    rebuilt = SummaryStore(test_summary_file)
+    rebuild_summary(rebuilt, records, 'alice')
+    assert rebuilt.accounts == incremental.accounts, "Rebuild should match incremental summary"
+    print("   ✓ Out-of-order history rebuilt correctly")
+
+    _cleanup()
+    print("\n✓ Rebuild test passed")
+    return True
+
+
+def test_render_html():
+    """Test rendering the report from the summary"""
+    print("\n" + "=" * 60)
+    print("Test: HTML Rendering")
+    print("=" * 60)
+
+    store = SummaryStore(test_summary_file)
+    store.update('alice', '2025-10-31', 1000, 1000)
+    store.update('alice', '2025-11-01', 1100, 100)
+    store.update('<bob>', '2025-10-31', 500, 500)
+    store.update('<bob>', '2025-11-01', 490, -10)
+
+    movers = store.top_movers()
+    assert movers[0][0] == 'alice', "Largest mover should rank first"
+    assert store.monthly_totals()[-1] == ('2025-11', 90, 100, 10), "Monthly totals incorrect"
+
+    page = render_html(store)
+    assert '<svg' in page, "Report should contain SVG charts"
+    assert '@&lt;bob&gt;' in page, "Account names should be escaped"
+    print("   ✓ HTML report rendered")
+
+    _cleanup()
+    print("\n✓ HTML rendering test passed")
+    return True
+
+
+def run_all_tests():
+    """Run all report tests"""
+    print("=" * 60)
+    print("Report Summary - Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_incremental_update,
+        test_rebuild_matches_incremental,
+        test_render_html
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+
+    _cleanup()
+
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+    print(f"  Passed: {passed}/{len(tests)}")
+    print(f"  Failed: {failed}/{len(tests)}")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
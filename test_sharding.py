@@ -0,0 +1,207 @@
+"""
+Test script for multi-account sharding
+Tests shard assignment stability, minimal movement and deduplicating merge
+"""
+import os
+import shutil
+import sys
+from report import SummaryStore
+from storage import BatchSaveError, CSVStorage
+from sharding import load_accounts, merge_shards, run_shard, select_accounts, shard_for
+
+test_dir = 'test_shards'
+test_csv_file = 'test_sharding_log.csv'
+
+
+def _cleanup():
+    if os.path.exists(test_dir):
+        shutil.rmtree(test_dir)
+    for path in (test_csv_file, 'test_sharding_anomaly.json', 'test_sharding_summary.json'):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def test_shard_assignment():
+    """Test that every account lands in exactly one shard"""
+    print("\n" + "=" * 60)
+    print("Test: Shard Assignment")
+    print("=" * 60)
+
+    accounts = [f"user{i}" for i in range(10000)]
+    shards = [select_accounts(accounts, i, 8) for i in range(8)]
+    assert sum(len(s) for s in shards) == len(accounts), "Accounts should be partitioned"
+    assert all(900 < len(s) < 1600 for s in shards), f"Shards unbalanced: {[len(s) for s in shards]}"
+    print(f"   ✓ Shard sizes: {[len(s) for s in shards]}")
+
+    assert shard_for('Alice', 8) == shard_for('alice', 8), "Assignment should ignore case"
+    print("   ✓ Assignment is case-insensitive")
+
+    print("\n✓ Shard assignment test passed")
+    return True
+
+
+def test_minimal_movement():
+    """Test that adding a runner moves only ~1/N of accounts"""
+    print("\n" + "=" * 60)
+    print("Test: Minimal Movement")
+    print("=" * 60)
+
+    accounts = [f"user{i}" for i in range(10000)]
+    moved = [a for a in accounts if shard_for(a, 8) != shard_for(a, 9)]
+    assert all(shard_for(a, 9) == 8 for a in moved), "Moved accounts should go to the new shard"
+    fraction = len(moved) / len(accounts)
+    assert 0.08 < fraction < 0.14, f"Expected ~1/9 moved, got {fraction:.3f}"
+    print(f"   ✓ {fraction:.1%} of accounts moved from 8 to 9 shards")
+
+    print("\n✓ Minimal movement test passed")
+    return True
+
+
+def test_load_accounts():
+    """Test account list parsing"""
+    print("\n" + "=" * 60)
+    print("Test: Account Loading")
+    print("=" * 60)
+
+    os.environ['X_USERNAMES'] = ' @alice, bob,,Alice '
+    assert load_accounts() == ['alice', 'bob'], "Should strip, drop '@' and dedupe"
+    os.environ.pop('X_USERNAMES', None)
+    print("   ✓ X_USERNAMES parsed")
+
+    print("\n✓ Account loading test passed")
+    return True
+
+
+def test_run_and_merge():
+    """Test shard runs merged into CSV storage without duplicates"""
+    print("\n" + "=" * 60)
+    print("Test: Run and Merge")
+    print("=" * 60)
+
+    _cleanup()
+    os.environ['ANOMALY_STATE_FILE'] = 'test_sharding_anomaly.json'
+    os.environ['REPORT_SUMMARY_FILE'] = 'test_sharding_summary.json'
+
+    accounts = [f"user{i}" for i in range(50)]
+    counts = {a: 1000 + i for i, a in enumerate(accounts)}
+    for i in range(4):
+        run_shard(accounts, i, 4, test_dir, fetch=counts.get)
+
+    storage = CSVStorage(test_csv_file)
+    storage.initialize()
+
+    batch = merge_shards(storage, test_dir)
+    assert len(batch) == 50, f"Expected 50 records, got {len(batch)}"
+    records = list(storage.iter_records())
+    assert sorted(r['account'] for r in records) == sorted(accounts), "Each account recorded once"
+    print("   ✓ All shards merged")
+
+    # Re-merge must not read the backend's history
+    iter_records = storage.iter_records
+    storage.iter_records = lambda: (_ for _ in ()).throw(AssertionError("history scanned"))
+    batch = merge_shards(storage, test_dir)
+    storage.iter_records = iter_records
+    assert batch == [], "Re-running merge should not write duplicates"
+    assert len(list(storage.iter_records())) == 50, "No duplicate rows"
+    print("   ✓ Re-merge writes no duplicates without scanning history")
+
+    # Lost summary: an explicit bootstrap recovers the index from storage
+    os.remove('test_sharding_summary.json')
+    batch = merge_shards(storage, test_dir, bootstrap=True)
+    assert batch == [], "Bootstrapped merge should not write duplicates"
+    assert len(list(storage.iter_records())) == 50, "No duplicate rows"
+    print("   ✓ Bootstrap rebuilds the index from history")
+
+    os.environ.pop('ANOMALY_STATE_FILE', None)
+    os.environ.pop('REPORT_SUMMARY_FILE', None)
+    _cleanup()
+    print("\n✓ Run and merge test passed")
+    return True
+
+
+class _PartialStorage(CSVStorage):
+    """CSV storage that saves only the first half of a batch"""
+
+    def save_records(self, batch):
+        saved = batch[:len(batch) // 2]
+        super().save_records(saved)
+        raise BatchSaveError("partial failure", saved, [(r, Exception("boom")) for r in batch[len(saved):]])
+
+
+def test_partial_merge_updates_state():
+    """Test that records saved before a batch failure reach the summary"""
+    print("\n" + "=" * 60)
+    print("Test: Partial Merge Failure")
+    print("=" * 60)
+
+    _cleanup()
+    os.environ['ANOMALY_STATE_FILE'] = 'test_sharding_anomaly.json'
+    os.environ['REPORT_SUMMARY_FILE'] = 'test_sharding_summary.json'
+
+    accounts = [f"user{i}" for i in range(10)]
+    run_shard(accounts, 0, 1, test_dir, fetch=lambda a: 100)
+
+    storage = _PartialStorage(test_csv_file)
+    storage.initialize()
+    try:
+        merge_shards(storage, test_dir)
+        print("   ✗ Should have raised BatchSaveError")
+        return False
+    except BatchSaveError as e:
+        saved_accounts = {r['account'] for r in e.saved}
+
+    summary = SummaryStore('test_sharding_summary.json')
+    assert set(summary.accounts) == saved_accounts, "Saved records should be in the summary"
+    assert len(saved_accounts) == 5, f"Expected 5 saved accounts, got {len(saved_accounts)}"
+    print("   ✓ Saved subset folded into summary before raising")
+
+    os.environ.pop('ANOMALY_STATE_FILE', None)
+    os.environ.pop('REPORT_SUMMARY_FILE', None)
+    _cleanup()
+    print("\n✓ Partial merge failure test passed")
+    return True
+
+
+def run_all_tests():
+    """Run all sharding tests"""
+    print("=" * 60)
+    print("Sharding - Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_shard_assignment,
+        test_minimal_movement,
+        test_load_accounts,
+        test_run_and_merge,
+        test_partial_merge_updates_state
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+
+    _cleanup()
+
+    print("\n" + "=" * 60)
+    print("Test Summary")
+    print("=" * 60)
+    print(f"  Passed: {passed}/{len(tests)}")
+    print(f"  Failed: {failed}/{len(tests)}")
+    print("=" * 60)
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
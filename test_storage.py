@@ -2,9 +2,12 @@
 Test script for storage backends
 Tests both CSV and Sheets storage (mock mode for Sheets)
 """
+import csv
 import os
 import sys
-from storage import CSVStorage, get_storage_backend
+import threading
+from storage import (BatchSaveError, CSVStorage, NotionStorage, SheetsStorage, _RateLimiter,
+                     get_storage_backend, parse_rate)
 
 # Test CSV Storage
 def test_csv_storage():
@@ -59,6 +62,264 @@ def test_csv_storage():
     return True
 
 
+def test_csv_iter_records():
+    """Test streaming typed records from CSV storage"""
+    print("\n" + "=" * 60)
+    print("Test: CSV Record Streaming")
+    print("=" * 60)
+
+    test_file = 'test_storage_iter.csv'
+
+    if os.path.exists(test_file):
+        os.remove(test_file)
+
+    storage = CSVStorage(test_file)
+
+    # Missing file streams nothing
+    print("\n1. Missing file:")
+    assert list(storage.iter_records()) == [], "Expected no records"
+    print("   ✓ No records")
+
+    storage.initialize()
+    storage.save_record(1234, 1234, 0.0)
+    storage.save_record(1250, 16, 1.2966)
+
+    print("\n2. Typed records:")
+    records = list(storage.iter_records())
+    assert len(records) == 2, f"Expected 2 records, got {len(records)}"
+    assert records[1]['followers_count'] == 1250, "followers_count should be int"
+    assert records[1]['delta'] == 16, "delta should be int"
+    assert records[1]['rate'] == 1.30, f"Expected rate 1.30, got {records[1]['rate']}"
+    assert records[1]['account'] is None, "Single-account rows have no account"
+    print("   ✓ Records parsed with typed columns")
+
+    print("\n3. Rate parsing:")
+    assert parse_rate("+1.30%") == 1.30
+    assert parse_rate("-0.80%") == -0.80
+    assert parse_rate("") is None
+    print("   ✓ Rate strings parsed")
+
+    os.remove(test_file)
+    print("\n✓ CSV record streaming test passed")
+    return True
+
+
+def _make_batch(count):
+    """Build a batch of multi-account records"""
+    return [
+        {'date': '2025-11-09', 'account': f"user{i}", 'followers_count': 1000 + i, 'delta': i, 'rate': 0.5}
+        for i in range(count)
+    ]
+
+
+def test_csv_save_records():
+    """Test batch save to CSV storage"""
+    print("\n" + "=" * 60)
+    print("Test: CSV Batch Save")
+    print("=" * 60)
+
+    test_file = 'test_storage_batch.csv'
+
+    if os.path.exists(test_file):
+        os.remove(test_file)
+
+    storage = CSVStorage(test_file)
+    storage.initialize()
+    storage.save_records(_make_batch(100))
+
+    records = list(storage.iter_records())
+    assert len(records) == 100, f"Expected 100 records, got {len(records)}"
+    assert records[42]['account'] == 'user42', "Account column should be written"
+    assert records[42]['followers_count'] == 1042, "Counts should round-trip"
+    assert records[42]['rate'] == 0.5, "Rate should round-trip"
+    print("   ✓ 100 records written in one batch")
+
+    os.remove(test_file)
+    print("\n✓ CSV batch save test passed")
+    return True
+
+
+def test_csv_header_upgrade():
+    """Test that legacy 4-column CSV headers gain the account column"""
+    print("\n" + "=" * 60)
+    print("Test: CSV Header Upgrade")
+    print("=" * 60)
+
+    test_file = 'test_storage_legacy.csv'
+
+    with open(test_file, 'w', newline='') as f:
+        f.write("date,followers_count,delta,rate\n2025-11-08,1234,0,0.00%\n")
+
+    storage = CSVStorage(test_file)
+    storage.initialize()
+    storage.save_records(_make_batch(1))
+
+    with open(test_file, 'r') as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0].keys()) == ['date', 'followers_count', 'delta', 'rate', 'account'], "Header not upgraded"
+    assert rows[0]['followers_count'] == '1234', "Existing rows should be kept"
+    assert rows[1]['account'] == 'user0', "Account should be a named column"
+    assert storage.load_last_record() == 1234, "Legacy rows are single-account rows"
+    print("   ✓ Header upgraded and rows preserved")
+
+    os.remove(test_file)
+    print("\n✓ CSV header upgrade test passed")
+    return True
+
+
+def test_csv_last_record_per_account():
+    """Test that multi-account rows don't leak into single-account history"""
+    print("\n" + "=" * 60)
+    print("Test: CSV Last Record Per Account")
+    print("=" * 60)
+
+    test_file = 'test_storage_accounts.csv'
+
+    if os.path.exists(test_file):
+        os.remove(test_file)
+
+    storage = CSVStorage(test_file)
+    storage.initialize()
+    storage.save_record(1250, 16, 1.30)
+    storage.save_records(_make_batch(3))
+
+    last_count = storage.load_last_record()
+    assert last_count == 1250, f"Expected single-account 1250, got {last_count}"
+    print(f"   ✓ Single-account last record: {last_count}")
+
+    last_count = storage.load_last_record('user1')
+    assert last_count == 1001, f"Expected user1 1001, got {last_count}"
+    print(f"   ✓ Per-account last record: {last_count}")
+
+    assert storage.load_last_record('nobody') == 0, "Unknown account has no history"
+
+    os.remove(test_file)
+    print("\n✓ CSV last record per account test passed")
+    return True
+
+
+class _FakeWorksheet:
+    """Records calls made by SheetsStorage"""
+
+    def __init__(self):
+        self.calls = []
+
+    def append_rows(self, rows):
+        self.calls.append(rows)
+
+
+class _FakeAPIError(Exception):
+    """Mimics notion_client's APIResponseError status/code attributes"""
+
+    def __init__(self, status, code):
+        super().__init__(f"{status} {code}")
+        self.status = status
+        self.code = code
+
+
+class _FakePages:
+    """Records pages created by NotionStorage, raising scripted errors per account"""
+
+    def __init__(self, errors=None):
+        self.created = []
+        self.attempts = {}
+        self.errors = errors or {}
+        self.lock = threading.Lock()
+
+    def create(self, parent, properties):
+        account = properties['Account']['rich_text'][0]['text']['content']
+        with self.lock:
+            attempt = self.attempts.get(account, 0)
+            self.attempts[account] = attempt + 1
+            errors = self.errors.get(account, [])
+            if attempt < len(errors):
+                raise errors[attempt]
+            self.created.append(properties)
+
+
+class _FakeNotionClient:
+    def __init__(self, errors=None):
+        self.pages = _FakePages(errors)
+
+
+def _make_notion(errors=None):
+    """Build a NotionStorage around a fake client, bypassing __init__"""
+    notion = NotionStorage.__new__(NotionStorage)
+    notion.database_id = 'db'
+    notion.max_workers = 4
+    notion._rate_limiter = _RateLimiter(1000.0)
+    notion.RETRY_BACKOFF = 0
+    notion.client = _FakeNotionClient(errors)
+    return notion
+
+
+def test_remote_save_records():
+    """Test batch save call patterns for Sheets and Notion"""
+    print("\n" + "=" * 60)
+    print("Test: Sheets/Notion Batch Save")
+    print("=" * 60)
+
+    # Bypass __init__ to avoid connecting to remote services
+    sheets = SheetsStorage.__new__(SheetsStorage)
+    sheets.worksheet = _FakeWorksheet()
+    sheets.save_records(_make_batch(500))
+    assert len(sheets.worksheet.calls) == 1, "Sheets should use a single append_rows call"
+    assert len(sheets.worksheet.calls[0]) == 500, "All rows should be in the call"
+    assert sheets.worksheet.calls[0][0] == ['2025-11-09', 1000, 0, '0.50%', 'user0'], "Row format incorrect"
+    print("   ✓ Sheets: 500 records in one append_rows call")
+
+    notion = _make_notion()
+    notion.save_records(_make_batch(50))
+    created = notion.client.pages.created
+    assert len(created) == 50, f"Expected 50 pages, got {len(created)}"
+    accounts = sorted(p['Account']['rich_text'][0]['text']['content'] for p in created)
+    assert accounts == sorted(f"user{i}" for i in range(50)), "Each record should become one page"
+    print("   ✓ Notion: 50 pages created through worker pool")
+
+    print("\n✓ Sheets/Notion batch save test passed")
+    return True
+
+
+def test_notion_retries_and_failures():
+    """Test Notion rate-limit retries and partial batch failures"""
+    print("\n" + "=" * 60)
+    print("Test: Notion Retries and Partial Failures")
+    print("=" * 60)
+
+    rate_limited = _FakeAPIError(429, 'rate_limited')
+    notion = _make_notion({
+        'user0': [_FakeAPIError(429, 'unknown')],                     # 429 once, then ok
+        'user1': [_FakeAPIError(400, 'rate_limited')] * 2,            # rate_limited twice, then ok
+        'user2': [_FakeAPIError(400, 'validation_error')],            # permanent, no retry
+        'user3': [rate_limited] * NotionStorage.MAX_RETRIES,          # retries exhausted
+    })
+
+    try:
+        notion.save_records(_make_batch(6))
+        print("   ✗ Should have raised BatchSaveError")
+        return False
+    except BatchSaveError as e:
+        saved = [r['account'] for r in e.saved]
+        failed = {r['account']: error for r, error in e.failed}
+
+    attempts = notion.client.pages.attempts
+    assert attempts['user0'] == 2, f"429 should be retried once, got {attempts['user0']} attempts"
+    assert attempts['user1'] == 3, f"rate_limited should be retried twice, got {attempts['user1']} attempts"
+    assert attempts['user2'] == 1, "Non-rate-limit errors should not be retried"
+    assert attempts['user3'] == NotionStorage.MAX_RETRIES, "Retries should stop at MAX_RETRIES"
+    print(f"   ✓ Retry counts: {dict(sorted(attempts.items()))}")
+
+    assert saved == ['user0', 'user1', 'user4', 'user5'], f"Unexpected saved records: {saved}"
+    assert sorted(failed) == ['user2', 'user3'], f"Unexpected failed records: {sorted(failed)}"
+    assert failed['user2'].code == 'validation_error' and failed['user3'] is rate_limited, \
+        "Failures should carry the final error"
+    assert len(notion.client.pages.created) == 4, "Only saved records should create pages"
+    print("   ✓ BatchSaveError splits saved and failed records")
+
+    print("\n✓ Notion retries and partial failures test passed")
+    return True
+
+
 def test_storage_factory():
     """Test storage factory function"""
     print("\n" + "=" * 60)
@@ -103,6 +364,12 @@ def run_all_tests():
 
     tests = [
         test_csv_storage,
+        test_csv_iter_records,
+        test_csv_save_records,
+        test_csv_last_record_per_account,
+        test_csv_header_upgrade,
+        test_remote_save_records,
+        test_notion_retries_and_failures,
         test_storage_factory
     ]
 
@@ -5,6 +5,11 @@ Tests core functionality without actual API calls
 import csv
 import os
 import datetime
+import json
+import subprocess
+import sys
+import tempfile
+import time
 
 # Mock test data
 test_csv_file = 'test_followers_log.csv'
@@ -170,6 +175,71 @@ def test_data_persistence():
     return True
 
 
+def test_cached_fast_path():
+    """Test 6: CSV run with a cached count skips the HTTP stack"""
+    print("\n" + "=" * 60)
+    print("Test 6: Cached Fast Path (no requests import)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'cache.json')
+        with open(cache_file, 'w') as f:
+            json.dump({'alice': {'count': 1234, 'fetched_at': time.time()}}, f)
+
+        env = dict(os.environ)
+        env.update({
+            'X_BEARER_TOKEN': 'test-token',
+            'X_USERNAME': 'Alice',
+            'STORAGE_TYPE': 'csv',
+            'CSV_FILE_PATH': os.path.join(tmp, 'log.csv'),
+            'FOLLOWERS_CACHE_TTL': '3600',
+            'FOLLOWERS_CACHE_FILE': cache_file,
+            'ANOMALY_STATE_FILE': os.path.join(tmp, 'anomaly.json'),
+            'REPORT_SUMMARY_FILE': os.path.join(tmp, 'summary.json'),
+        })
+        script = "import sys, main; main.main(); print('requests loaded:', 'requests' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', script], env=env, capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+        assert result.returncode == 0, f"Run failed: {result.stderr}"
+        assert 'requests loaded: False' in result.stdout, "requests should not be imported"
+        with open(os.path.join(tmp, 'log.csv'), 'r') as f:
+            rows = list(csv.reader(f))
+        assert rows[-1][1] == '1234', f"Expected cached count 1234, got {rows[-1][1]}"
+
+    print("✓ Cached CSV run recorded without importing requests")
+    return True
+
+
+def test_followers_cache():
+    """Test 7: Followers cache loads once and writes once per run"""
+    print("\n" + "=" * 60)
+    print("Test 7: Followers Cache (single load/write)")
+    print("=" * 60)
+
+    from main import FollowersCache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'cache.json')
+        cache = FollowersCache(cache_file, ttl=3600)
+        for i in range(1000):
+            cache.set(f"user{i}", i)
+        assert not os.path.exists(cache_file), "Nothing should be written before save()"
+        cache.save()
+
+        reloaded = FollowersCache(cache_file, ttl=3600)
+        assert reloaded.get('USER42') == 42, "Cached count should round-trip (case-insensitive)"
+        assert FollowersCache(cache_file, ttl=0).get('user42') is None, "TTL 0 disables cache"
+
+        stale = FollowersCache(cache_file, ttl=3600)
+        stale.get('user0')
+        stale.entries['user0']['fetched_at'] -= 7200
+        assert stale.get('user0') is None, "Stale entries should be ignored"
+
+    print("✓ 1000 counts cached with one write")
+    return True
+
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 60)
@@ -181,7 +251,9 @@ def run_all_tests():
         test_first_run,
         test_second_run,
         test_third_run_with_loss,
-        test_data_persistence
+        test_data_persistence,
+        test_cached_fast_path,
+        test_followers_cache
     ]
 
     passed = 0